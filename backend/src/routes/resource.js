@@ -228,7 +228,9 @@ async function getDecryptableKey(resourceId, callerOrgId, ownerOrgId, encryptedK
       owner_id: ownerOrgId,
       capsule: reencryptResponse.data.capsule,
       ciphertext: reencryptResponse.data.ciphertext,
-      cfrags: reencryptResponse.data.cfrags
+      cfrags: reencryptResponse.data.cfrags,
+      // cfrags come straight from our own /reencrypt, so verification can be skipped
+      trusted_cfrags: true
     }, {
       timeout: 5000
     });
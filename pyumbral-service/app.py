@@ -15,30 +15,48 @@ Official Documentation References:
 
 SECURITY NOTES:
   - Private keys are NEVER logged or returned in API responses
-  - Private keys are stored ONLY in HashiCorp Vault
+  - Private keys are persisted ONLY in HashiCorp Vault; owners' parsed
+    delegating/signing keys are also held in process memory for up to 60 s
+    (DELEGATING_SK_CACHE / SIGNER_CACHE) so /rekey bursts skip Vault reads
   - ReKeys have expiry times and are stored in transient Vault paths
 """
 
 import os
-import uuid
+import sys
+import asyncio
 import time
 import base64
+import binascii
+import struct
 import logging
+import itertools
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel, Field
-import hvac
+from pydantic import BaseModel, ConfigDict, Field
+from cachetools import TLRUCache, TTLCache
+import httpx
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, every worker runs the purge
+    fcntl = None
 
 # pyUmbral imports (per https://pyumbral.readthedocs.io/en/latest/api.html)
 from umbral import (
     SecretKey,
+    PublicKey,
     Signer,
     Capsule,
     KeyFrag,
     VerifiedKeyFrag,
     CapsuleFrag,
+    VerifiedCapsuleFrag,
     encrypt,
     decrypt_original,
     generate_kfrags,
@@ -61,24 +79,155 @@ VAULT_KV_MOUNT = os.getenv("VAULT_KV_MOUNT", "secret")
 # Backend API URL for chaincode calls (grantAccess)
 BACKEND_API_URL = os.getenv("BACKEND_API_URL", "http://127.0.0.1:3001")
 
+# Public key cache (owner_id -> {public_key, verifying_key}).
+# Public keys are immutable after /prepare; private keys are NEVER cached here.
+PUBKEY_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# Deserialized key object caches, so repeated requests skip EC point parsing.
+# PUBKEY_OBJ_CACHE: owner_id -> (delegating PublicKey, verifying PublicKey)
+# SIGNER_CACHE / DELEGATING_SK_CACHE: owner_id -> Signer / SecretKey; short
+#               TTL so private key material stays in process memory only
+#               briefly (never logged), while /rekey bursts skip the Vault read
+# KFRAGS_CACHE: rekey_id -> (expiry, [VerifiedKeyFrag]); entries expire at the
+#               rekey's own expiry so access windows are respected
+PUBKEY_OBJ_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+SIGNER_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+DELEGATING_SK_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+KFRAGS_CACHE: TLRUCache = TLRUCache(
+    maxsize=10_000, ttu=lambda _key, value, _now: value[0], timer=time.time
+)
+
+# Thread pool for the pyUmbral calls made from handlers: key generation, every
+# key/capsule/fragment parse and the Umbral primitives (only serializing results
+# with bytes() stays on the event loop). The native OpenSSL calls release the
+# GIL, so per-fragment work runs in parallel across cores. The cachetools
+# caches are not thread-safe, so they are only touched on the event loop and
+# pool threads just parse on a miss. On Linux each pool thread is pinned round-robin to one CPU when it
+# starts, keeping its caches warm instead of migrating between cores. The
+# round-robin is offset by PID: the executor reuses idle threads, so under
+# light load each worker process runs mostly on its first thread, and without
+# the offset every uvicorn worker would pin that thread to the same CPU.
+_AFFINITY_CPUS = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+_AFFINITY_NEXT = itertools.count()
+
+
+def _pin_executor_thread() -> None:
+    """ThreadPoolExecutor initializer: pin the calling thread to one CPU"""
+    if not _AFFINITY_CPUS:
+        return
+    slot = os.getpid() + next(_AFFINITY_NEXT)
+    cpu = _AFFINITY_CPUS[slot % len(_AFFINITY_CPUS)]
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError as e:
+        logger.warning(f"Could not pin executor thread to CPU {cpu}: {e}")
+
+
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="umbral",
+    initializer=_pin_executor_thread,
+)
+
+
+
+async def run_on_executor(func, /, *args, **kwargs):
+    """Run a blocking pyUmbral call on EXECUTOR without stalling the event loop"""
+    return await asyncio.get_running_loop().run_in_executor(EXECUTOR, partial(func, *args, **kwargs))
+
+
+# Pooled async Vault client, created per worker process in lifespan()
+VAULT: Optional[httpx.AsyncClient] = None
+
+# /health caches its Vault probe result for this many seconds so frequent
+# LB/Kubernetes probes do not each cost a Vault round-trip. "probe" is the
+# in-flight Vault check, shared by every /health call that arrives while it
+# runs; "ts" starts at -inf so the first call always probes.
+HEALTH_CACHE_TTL = 2.0
+_HEALTH_CACHE = {"ts": float("-inf"), "ok": False, "probe": None}
+
+# Interval (seconds) between background purges of expired rekeys
+REKEY_PURGE_INTERVAL = 60
+
+# Max concurrent Vault requests per purge, so the purge cannot drain the
+# shared connection pool used by the request handlers
+REKEY_PURGE_CONCURRENCY = 8
+
+# Only the worker holding this lock runs the purge loop
+REKEY_PURGE_LOCK = os.getenv(
+    "REKEY_PURGE_LOCK", os.path.join(tempfile.gettempdir(), "pyumbral-rekey-purge.lock")
+)
+
+# Strong references to fire-and-forget tasks so they are not garbage collected
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the Vault connection pool and start the expired-rekey purge task
+    on startup; stop both on shutdown.
+    Ref: https://fastapi.tiangolo.com/advanced/events/#lifespan
+    """
+    global VAULT
+    VAULT = httpx.AsyncClient(
+        base_url=VAULT_ADDR,
+        headers={"X-Vault-Token": VAULT_TOKEN},
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        http2=True,
+    )
+    try:
+        await get_vault_client_checked()
+    except HTTPException as e:
+        logger.warning(f"Vault check failed at startup: {e.detail}")
+    purge_lock = acquire_purge_lock()
+    purge_task = asyncio.create_task(purge_expired_rekeys_loop()) if purge_lock else None
+    try:
+        yield
+    finally:
+        if purge_task:
+            purge_task.cancel()
+        if purge_lock:
+            purge_lock.close()
+        await VAULT.aclose()
+        VAULT = None
+
+
 app = FastAPI(
     title="pyUmbral Proxy Re-Encryption Service",
     description="Microservice for Umbral proxy re-encryption operations",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
-def get_vault_client() -> hvac.Client:
+def get_vault_client() -> httpx.AsyncClient:
     """
-    Initialize and return a Vault client.
-    Ref: https://developer.hashicorp.com/vault/docs/get-started/developer-qs
+    Return the pooled Vault client.
+
+    No authentication probe is made here; a 401/403 from Vault on the
+    actual operation is mapped to 503 by check_vault_response().
+    Ref: https://developer.hashicorp.com/vault/api-docs/secret/kv/kv-v2
     """
-    client = hvac.Client(url=VAULT_ADDR, token=VAULT_TOKEN)
-    if not client.is_authenticated():
+    if VAULT is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail="Failed to authenticate with Vault"
+            detail="Vault client not initialized"
         )
+    return VAULT
+
+
+async def get_vault_client_checked() -> httpx.AsyncClient:
+    """
+    Return the pooled Vault client after verifying its token.
+
+    Costs an extra Vault round-trip, so it is only used by /health and at
+    startup, never on the hot path.
+    Ref: https://developer.hashicorp.com/vault/api-docs/auth/token#lookup-a-token-self
+    """
+    client = get_vault_client()
+    response = await vault_request(client, "GET", "/v1/auth/token/lookup-self")
+    check_vault_response(response)
     return client
 
 
@@ -99,19 +248,26 @@ class PrepareResponse(BaseModel):
     message: str
 
 
+# Hot-path models below use bare annotations (no per-field descriptions);
+# field documentation lives in the endpoint docstrings instead.
+
 class RekeyRequest(BaseModel):
     """Request model for /rekey endpoint"""
-    owner_id: str = Field(..., description="Owner's unique identifier")
-    recipient_id: str = Field(..., description="Recipient's unique identifier")
-    resource_id: str = Field(..., description="Resource ID to grant access to")
-    expiry: int = Field(..., description="Unix timestamp when rekey expires")
-    threshold: int = Field(default=1, ge=1, description="Threshold for kfrags (M of N)")
-    shares: int = Field(default=1, ge=1, description="Total number of kfrags (N)")
+    model_config = ConfigDict(extra="forbid")
+
+    owner_id: str
+    recipient_id: str
+    resource_id: str
+    expiry: int
+    threshold: int = Field(default=1, ge=1)
+    shares: int = Field(default=1, ge=1)
 
 
 class RekeyResponse(BaseModel):
     """Response model for /rekey endpoint"""
-    rekey_id: str = Field(..., description="Unique ID for this rekey operation")
+    model_config = ConfigDict(frozen=True)
+
+    rekey_id: str
     owner_id: str
     recipient_id: str
     resource_id: str
@@ -123,17 +279,53 @@ class RekeyResponse(BaseModel):
 
 class ReencryptRequest(BaseModel):
     """Request model for /reencrypt endpoint"""
-    rekey_id: str = Field(..., description="ReKey ID from /rekey response")
-    capsule: str = Field(..., description="Base64-encoded Umbral Capsule")
-    ciphertext: str = Field(..., description="Base64-encoded ciphertext")
+    model_config = ConfigDict(extra="forbid")
+
+    rekey_id: str
+    capsule: str
+    ciphertext: str
 
 
 class ReencryptResponse(BaseModel):
     """Response model for /reencrypt endpoint"""
+    model_config = ConfigDict(frozen=True)
+
+    rekey_id: str
+    cfrags: list[str]
+    capsule: str
+    ciphertext: str
+    message: str
+
+
+class ReencryptBatchItem(BaseModel):
+    """Single (rekey_id, capsule) pair in a /reencrypt_batch request"""
+    model_config = ConfigDict(extra="forbid")
+
+    rekey_id: str
+    capsule: str
+
+
+class ReencryptBatchRequest(BaseModel):
+    """Request model for /reencrypt_batch endpoint"""
+    model_config = ConfigDict(extra="forbid")
+
+    items: list[ReencryptBatchItem] = Field(..., min_length=1, max_length=256)
+
+
+class ReencryptBatchResult(BaseModel):
+    """CFrags for one input item, keyed back by its index in the request"""
+    model_config = ConfigDict(frozen=True)
+
+    index: int
     rekey_id: str
-    cfrags: list[str] = Field(..., description="Base64-encoded CapsuleFragments")
-    capsule: str = Field(..., description="Original capsule (base64)")
-    ciphertext: str = Field(..., description="Original ciphertext (base64)")
+    cfrags: list[str]
+
+
+class ReencryptBatchResponse(BaseModel):
+    """Response model for /reencrypt_batch endpoint"""
+    model_config = ConfigDict(frozen=True)
+
+    results: list[ReencryptBatchResult]
     message: str
 
 
@@ -148,58 +340,371 @@ class HealthResponse(BaseModel):
 # Utility Functions
 # ============================================================================
 
-def store_secret_in_vault(client: hvac.Client, path: str, data: dict) -> None:
+def check_vault_response(response: httpx.Response) -> None:
+    """Map Vault error responses to 503 so callers see a consistent failure"""
+    if response.status_code in (401, 403):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to authenticate with Vault"
+        )
+    if response.is_error:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Vault request failed with status {response.status_code}"
+        )
+
+
+async def vault_request(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """Issue a Vault API request, mapping transport errors to 503"""
+    try:
+        return await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Vault unreachable: {e.__class__.__name__}"
+        )
+
+
+async def store_secret_in_vault(client: httpx.AsyncClient, path: str, data: dict) -> None:
     """
     Store a secret in Vault KV v2 engine.
-    Ref: https://developer.hashicorp.com/vault/docs/get-started/developer-qs#step-4-store-a-secret
+    Ref: https://developer.hashicorp.com/vault/api-docs/secret/kv/kv-v2#create-update-secret
     """
-    client.secrets.kv.v2.create_or_update_secret(
-        mount_point=VAULT_KV_MOUNT,
-        path=path,
-        secret=data
+    response = await vault_request(
+        client, "POST", f"/v1/{VAULT_KV_MOUNT}/data/{path}", json={"data": data}
     )
+    check_vault_response(response)
     logger.info(f"Stored secret at path: {path} (contents not logged)")
 
 
-def read_secret_from_vault(client: hvac.Client, path: str) -> Optional[dict]:
+async def read_secret_from_vault(client: httpx.AsyncClient, path: str) -> Optional[dict]:
     """
     Read a secret from Vault KV v2 engine.
-    Ref: https://developer.hashicorp.com/vault/docs/get-started/developer-qs#step-5-retrieve-a-secret
+    Ref: https://developer.hashicorp.com/vault/api-docs/secret/kv/kv-v2#read-secret-version
     """
-    try:
-        response = client.secrets.kv.v2.read_secret_version(
-            mount_point=VAULT_KV_MOUNT,
-            path=path
-        )
-        return response["data"]["data"]
-    except hvac.exceptions.InvalidPath:
+    response = await vault_request(client, "GET", f"/v1/{VAULT_KV_MOUNT}/data/{path}")
+    if response.status_code == 404:
         return None
+    check_vault_response(response)
+    return response.json()["data"]["data"]
 
 
-def delete_secret_from_vault(client: hvac.Client, path: str) -> None:
-    """Delete a secret from Vault"""
+async def delete_secret_from_vault(client: httpx.AsyncClient, path: str) -> None:
+    """
+    Delete a secret and all its versions from Vault.
+    Ref: https://developer.hashicorp.com/vault/api-docs/secret/kv/kv-v2#delete-metadata-and-all-versions
+    Failures are logged, not raised; a 404 (already deleted) is not a failure.
+    """
     try:
-        client.secrets.kv.v2.delete_metadata_and_all_versions(
-            mount_point=VAULT_KV_MOUNT,
-            path=path
+        response = await vault_request(client, "DELETE", f"/v1/{VAULT_KV_MOUNT}/metadata/{path}")
+        if response.status_code != 404:
+            check_vault_response(response)
+    except HTTPException as e:
+        logger.warning(f"Failed to delete secret at {path}: {e.detail}")
+
+
+def cache_owner_pubkeys(owner_id: str, owner_data: dict) -> dict:
+    """Cache and return only the public fields of an owner record"""
+    pubkeys = {
+        "public_key": owner_data["public_key"],
+        "verifying_key": owner_data["verifying_key"],
+    }
+    PUBKEY_CACHE[owner_id] = pubkeys
+    return pubkeys
+
+
+async def get_owner_pubkeys(client: httpx.AsyncClient, owner_id: str) -> Optional[dict]:
+    """
+    Return {public_key, verifying_key} for an owner, from cache or Vault.
+    Returns None if the owner has not called /prepare.
+    """
+    pubkeys = PUBKEY_CACHE.get(owner_id)
+    if pubkeys is not None:
+        return pubkeys
+    owner_data = await read_secret_from_vault(client, f"umbral/owners/{owner_id}")
+    if not owner_data:
+        return None
+    return cache_owner_pubkeys(owner_id, owner_data)
+
+
+def decode_secret_key(value: str) -> SecretKey:
+    """
+    Parse a secret key stored in Vault.
+
+    Keys are stored base64-encoded; owners registered before that change
+    have hex-encoded keys, told apart by their length.
+    """
+    if len(value) == 2 * SecretKey.serialized_size():
+        return SecretKey.from_bytes(bytes.fromhex(value))
+    return SecretKey.from_bytes(binascii.a2b_base64(value))
+
+
+def parse_owner_public_keys(pubkeys: dict):
+    """Parse (delegating_pk, verifying_pk) PublicKey objects from an owner record"""
+    return (
+        PublicKey.from_bytes(bytes.fromhex(pubkeys["public_key"])),
+        PublicKey.from_bytes(bytes.fromhex(pubkeys["verifying_key"])),
+    )
+
+
+async def load_owner_public_keys(owner_id: str, pubkeys: dict):
+    """Return (delegating_pk, verifying_pk) PublicKey objects for an owner"""
+    keys = PUBKEY_OBJ_CACHE.get(owner_id)
+    if keys is None:
+        keys = await run_on_executor(parse_owner_public_keys, pubkeys)
+        PUBKEY_OBJ_CACHE[owner_id] = keys
+    return keys
+
+
+def parse_owner_secrets(owner_data: dict):
+    """Parse (delegating_sk, signer) from an owner record read from Vault"""
+    delegating_sk = decode_secret_key(owner_data["delegating_secret_key"])
+    signer = Signer(decode_secret_key(owner_data["signing_secret_key"]))
+    return delegating_sk, signer
+
+
+async def load_owner_secrets(client: httpx.AsyncClient, owner_id: str):
+    """
+    Return (delegating_sk, signer, pubkeys) for an owner, or None if the
+    owner has not called /prepare. Vault is only read when any of the
+    cached objects has expired.
+    """
+    delegating_sk = DELEGATING_SK_CACHE.get(owner_id)
+    signer = SIGNER_CACHE.get(owner_id)
+    pubkeys = PUBKEY_CACHE.get(owner_id)
+    if delegating_sk is None or signer is None or pubkeys is None:
+        owner_data = await read_secret_from_vault(client, f"umbral/owners/{owner_id}")
+        if not owner_data:
+            return None
+        delegating_sk, signer = await run_on_executor(parse_owner_secrets, owner_data)
+        DELEGATING_SK_CACHE[owner_id] = delegating_sk
+        SIGNER_CACHE[owner_id] = signer
+        pubkeys = cache_owner_pubkeys(owner_id, owner_data)
+    return delegating_sk, signer, pubkeys
+
+
+def pack_kfrags_blob(kfrags: list[VerifiedKeyFrag]) -> str:
+    """
+    Serialize KFrags as one base64 string of length-prefixed records
+    (little-endian uint16 length + kfrag bytes, repeated).
+    """
+    parts = []
+    for kfrag in kfrags:
+        kfrag_bytes = bytes(kfrag)
+        parts.append(struct.pack("<H", len(kfrag_bytes)))
+        parts.append(kfrag_bytes)
+    return binascii.b2a_base64(b"".join(parts), newline=False).decode()
+
+
+def unpack_kfrags_blob(blob_b64: str):
+    """Yield each kfrag's bytes from a blob built by pack_kfrags_blob()"""
+    view = memoryview(binascii.a2b_base64(blob_b64))
+    offset = 0
+    while offset < len(view):
+        (length,) = struct.unpack_from("<H", view, offset)
+        offset += 2
+        yield bytes(view[offset:offset + length])
+        offset += length
+
+
+@lru_cache(maxsize=1024)
+def capsule_from_b64(capsule_b64: str) -> Capsule:
+    """
+    Parse a base64 Capsule, memoized on the string itself so bursts of
+    requests for the same capsule (e.g. chunked files) parse it once.
+    The decoded bytes are dropped once the Capsule is built.
+    """
+    return Capsule.from_bytes(binascii.a2b_base64(capsule_b64))
+
+
+def decode_kfrags(rekey_data: dict) -> list[VerifiedKeyFrag]:
+    """Parse the VerifiedKeyFrags stored in a rekey record"""
+    # Use from_verified_bytes since these were stored after verification
+    # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.VerifiedKeyFrag
+    if "kfrags_blob" in rekey_data:
+        return [
+            VerifiedKeyFrag.from_verified_bytes(kfrag_bytes)
+            for kfrag_bytes in unpack_kfrags_blob(rekey_data["kfrags_blob"])
+        ]
+    # Rekeys stored before kfrags_blob: JSON list of base64 strings
+    return [
+        VerifiedKeyFrag.from_verified_bytes(binascii.a2b_base64(kfrag_b64))
+        for kfrag_b64 in rekey_data["kfrags"]
+    ]
+
+
+async def load_kfrags(rekey_id: str, rekey_data: dict) -> list[VerifiedKeyFrag]:
+    """Return the VerifiedKeyFrags for a rekey, decoding only on cache miss"""
+    cached = KFRAGS_CACHE.get(rekey_id)
+    if cached is not None:
+        return cached[1]
+    kfrags = await run_on_executor(decode_kfrags, rekey_data)
+    KFRAGS_CACHE[rekey_id] = (rekey_data["expiry"], kfrags)
+    return kfrags
+
+
+def decode_cfrags(cfrags_b64: list[str], trusted: bool) -> list:
+    """
+    Parse base64 cfrags: VerifiedCapsuleFrags if trusted (produced by our
+    own /reencrypt), otherwise CapsuleFrags that still need verify().
+    Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.CapsuleFrag
+    """
+    cfrag_from_bytes = VerifiedCapsuleFrag.from_verified_bytes if trusted else CapsuleFrag.from_bytes
+    return [cfrag_from_bytes(binascii.a2b_base64(cfrag_b64)) for cfrag_b64 in cfrags_b64]
+
+
+# RFC 4648 base32 -> base32hex ("extended hex") alphabet, which sorts like the input
+_B32HEX_TABLE = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", b"0123456789ABCDEFGHIJKLMNOPQRSTUV")
+
+
+def generate_key_pair():
+    """Generate a random Umbral (SecretKey, PublicKey) pair"""
+    sk = SecretKey.random()
+    return sk, sk.public_key()
+
+
+def new_rekey_id() -> str:
+    """
+    Generate a ULID-style, time-ordered rekey ID: 48-bit millisecond
+    timestamp + 80 random bits, base32hex-encoded (26 chars) so IDs sort
+    lexically by creation time.
+    """
+    ts = int(time.time() * 1000).to_bytes(6, "big")
+    # base64.b32hexencode() needs Python 3.10; map the RFC 4648 alphabet instead
+    encoded = base64.b32encode(ts + os.urandom(10)).translate(_B32HEX_TABLE)
+    return encoded.decode().rstrip("=").lower()
+
+
+async def get_active_rekey(client: httpx.AsyncClient, rekey_id: str) -> dict:
+    """
+    Read a rekey record from Vault, refusing missing or expired rekeys.
+    Expired rekeys are deleted in the background; the 403 does not wait.
+    """
+    rekey_data = await read_secret_from_vault(client, f"umbral/rekeys/{rekey_id}")
+    if not rekey_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ReKey {rekey_id} not found"
         )
-    except Exception as e:
-        logger.warning(f"Failed to delete secret at {path}: {e}")
+    
+    # Check expiry
+    current_time = int(time.time())
+    if current_time > rekey_data["expiry"]:
+        # Clean up expired rekey without blocking the response
+        spawn_background(delete_secret_from_vault(client, f"umbral/rekeys/{rekey_id}"))
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"ReKey {rekey_id} has expired"
+        )
+    return rekey_data
+
+
+def spawn_background(coro) -> None:
+    """Run a coroutine fire-and-forget, keeping a reference until it finishes"""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+def acquire_purge_lock():
+    """
+    Take the non-blocking purge lock so only one uvicorn worker purges.
+    Returns the open lock file (held until closed), or None if another
+    worker already holds it or the lock file cannot be opened.
+    """
+    try:
+        lock_file = open(REKEY_PURGE_LOCK, "w")
+    except OSError as e:
+        logger.warning(f"Rekey purge disabled in this worker, cannot open {REKEY_PURGE_LOCK}: {e}")
+        return None
+    if fcntl is None:
+        return lock_file
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+async def purge_expired_rekeys(client: httpx.AsyncClient) -> int:
+    """
+    Delete all expired rekeys from Vault and return how many were purged.
+    Records that fail to read are skipped and retried on the next purge.
+    Ref: https://developer.hashicorp.com/vault/api-docs/secret/kv/kv-v2#list-secrets
+    """
+    response = await vault_request(
+        client, "GET", f"/v1/{VAULT_KV_MOUNT}/metadata/umbral/rekeys", params={"list": "true"}
+    )
+    if response.status_code == 404:
+        return 0
+    check_vault_response(response)
+    rekey_ids = [key for key in response.json()["data"]["keys"] if not key.endswith("/")]
+    
+    semaphore = asyncio.Semaphore(REKEY_PURGE_CONCURRENCY)
+
+    async def read_rekey(rekey_id: str) -> Optional[dict]:
+        async with semaphore:
+            try:
+                return await read_secret_from_vault(client, f"umbral/rekeys/{rekey_id}")
+            except HTTPException as e:
+                logger.warning(f"Failed to read rekey {rekey_id} during purge: {e.detail}")
+                return None
+
+    async def delete_rekey(rekey_id: str) -> None:
+        async with semaphore:
+            await delete_secret_from_vault(client, f"umbral/rekeys/{rekey_id}")
+
+    records = await asyncio.gather(*[read_rekey(rekey_id) for rekey_id in rekey_ids])
+    current_time = int(time.time())
+    expired = [
+        rekey_id for rekey_id, rekey_data in zip(rekey_ids, records)
+        if rekey_data and current_time > rekey_data["expiry"]
+    ]
+    await asyncio.gather(*[delete_rekey(rekey_id) for rekey_id in expired])
+    return len(expired)
+
+
+async def purge_expired_rekeys_loop() -> None:
+    """Background task: purge expired rekeys every REKEY_PURGE_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(REKEY_PURGE_INTERVAL)
+        try:
+            purged = await purge_expired_rekeys(get_vault_client())
+            if purged:
+                logger.info(f"Purged {purged} expired rekeys")
+        except Exception as e:
+            logger.warning(f"Expired rekey purge failed: {e}")
 
 
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint"""
+async def probe_vault() -> bool:
+    """Check the Vault token once and record the result in _HEALTH_CACHE"""
     vault_ok = False
     try:
-        client = get_vault_client()
-        vault_ok = client.is_authenticated()
+        await get_vault_client_checked()
+        vault_ok = True
     except Exception:
         pass
+    _HEALTH_CACHE.update(ts=time.monotonic(), ok=vault_ok, probe=None)
+    return vault_ok
+
+
+@app.get("/health", response_model=HealthResponse)
+async def health_check():
+    """Health check endpoint (Vault status cached for HEALTH_CACHE_TTL seconds)"""
+    if time.monotonic() - _HEALTH_CACHE["ts"] < HEALTH_CACHE_TTL:
+        vault_ok = _HEALTH_CACHE["ok"]
+    else:
+        probe = _HEALTH_CACHE["probe"]
+        if probe is None:
+            probe = asyncio.create_task(probe_vault())
+            _HEALTH_CACHE["probe"] = probe
+        # shield: a disconnecting caller must not cancel the shared probe
+        vault_ok = await asyncio.shield(probe)
     
     return HealthResponse(
         status="healthy" if vault_ok else "degraded",
@@ -218,7 +723,7 @@ async def prepare_owner(request: PrepareRequest):
     - Signing key pair (for kfrag signatures)
     
     Public keys are returned and can be stored on-chain.
-    Private keys are stored ONLY in Vault.
+    Private keys are persisted ONLY in Vault (see SECURITY NOTES).
     
     pyUmbral ref: https://pyumbral.readthedocs.io/en/latest/using_pyumbral.html#generate-an-umbral-key-pair
     """
@@ -226,8 +731,9 @@ async def prepare_owner(request: PrepareRequest):
     owner_id = request.owner_id
     
     # Check if owner already exists
-    existing = read_secret_from_vault(vault, f"umbral/owners/{owner_id}")
+    existing = await read_secret_from_vault(vault, f"umbral/owners/{owner_id}")
     if existing:
+        cache_owner_pubkeys(owner_id, existing)
         # Return existing public keys
         return PrepareResponse(
             owner_id=owner_id,
@@ -238,28 +744,32 @@ async def prepare_owner(request: PrepareRequest):
     
     # Generate new Umbral key pairs
     # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.SecretKey
-    delegating_sk = SecretKey.random()
-    delegating_pk = delegating_sk.public_key()
-    
-    signing_sk = SecretKey.random()
-    signing_pk = signing_sk.public_key()
+    (delegating_sk, delegating_pk), (signing_sk, signing_pk) = await asyncio.gather(
+        run_on_executor(generate_key_pair), run_on_executor(generate_key_pair)
+    )
     
     # Serialize keys
-    # Private keys use to_secret_bytes(), public keys use bytes()
-    delegating_sk_hex = delegating_sk.to_secret_bytes().hex()
+    # Private keys use to_secret_bytes() (base64, Vault only),
+    # public keys use bytes() (hex, returned to callers / stored on-chain)
+    delegating_sk_b64 = base64.b64encode(delegating_sk.to_secret_bytes()).decode()
     delegating_pk_hex = bytes(delegating_pk).hex()
-    signing_sk_hex = signing_sk.to_secret_bytes().hex()
+    signing_sk_b64 = base64.b64encode(signing_sk.to_secret_bytes()).decode()
     signing_pk_hex = bytes(signing_pk).hex()
     
     # Store in Vault (private keys NEVER logged)
-    store_secret_in_vault(vault, f"umbral/owners/{owner_id}", {
-        "delegating_secret_key": delegating_sk_hex,
+    await store_secret_in_vault(vault, f"umbral/owners/{owner_id}", {
+        "delegating_secret_key": delegating_sk_b64,
         "public_key": delegating_pk_hex,
-        "signing_secret_key": signing_sk_hex,
+        "signing_secret_key": signing_sk_b64,
         "verifying_key": signing_pk_hex,
         "created_at": datetime.now(timezone.utc).isoformat()
     })
     
+    cache_owner_pubkeys(owner_id, {
+        "public_key": delegating_pk_hex,
+        "verifying_key": signing_pk_hex,
+    })
+    
     logger.info(f"Registered new owner: {owner_id}")
     
     return PrepareResponse(
@@ -279,6 +789,16 @@ async def generate_rekey(request: RekeyRequest):
     The KFrags are stored in Vault under a transient path with expiry metadata.
     Records grantAccess on-chain via backend API.
     
+    Request fields:
+    - owner_id: Owner's unique identifier
+    - recipient_id: Recipient's unique identifier
+    - resource_id: Resource ID to grant access to
+    - expiry: Unix timestamp when rekey expires
+    - threshold: Threshold for kfrags (M of N), default 1
+    - shares: Total number of kfrags (N), default 1
+    
+    Response rekey_id is the unique ID for this rekey operation.
+    
     pyUmbral ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.generate_kfrags
     """
     vault = get_vault_client()
@@ -298,34 +818,31 @@ async def generate_rekey(request: RekeyRequest):
             detail="Threshold cannot exceed shares"
         )
     
-    # Get owner's keys from Vault
-    owner_data = read_secret_from_vault(vault, f"umbral/owners/{request.owner_id}")
-    if not owner_data:
+    # Get owner's keys and recipient's public key (both cached) concurrently
+    owner_secrets, recipient_data = await asyncio.gather(
+        load_owner_secrets(vault, request.owner_id),
+        get_owner_pubkeys(vault, request.recipient_id),
+    )
+    if not owner_secrets:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Owner {request.owner_id} not found. Call /prepare first."
         )
-    
-    # Get recipient's public key from Vault
-    recipient_data = read_secret_from_vault(vault, f"umbral/owners/{request.recipient_id}")
     if not recipient_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recipient {request.recipient_id} not found. They must call /prepare first."
         )
     
-    # Reconstruct keys from hex
+    # Reconstruct keys
     # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.SecretKey
-    delegating_sk = SecretKey.from_bytes(bytes.fromhex(owner_data["delegating_secret_key"]))
-    signing_sk = SecretKey.from_bytes(bytes.fromhex(owner_data["signing_secret_key"]))
-    signer = Signer(signing_sk)
-    
-    from umbral import PublicKey
-    receiving_pk = PublicKey.from_bytes(bytes.fromhex(recipient_data["public_key"]))
+    delegating_sk, signer, owner_data = owner_secrets
+    receiving_pk, _ = await load_owner_public_keys(request.recipient_id, recipient_data)
     
     # Generate KFrags
     # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.generate_kfrags
-    kfrags = generate_kfrags(
+    kfrags = await run_on_executor(
+        generate_kfrags,
         delegating_sk=delegating_sk,
         receiving_pk=receiving_pk,
         signer=signer,
@@ -336,20 +853,20 @@ async def generate_rekey(request: RekeyRequest):
     )
     
     # Generate unique rekey ID
-    rekey_id = str(uuid.uuid4())
+    rekey_id = new_rekey_id()
     
-    # Serialize KFrags (VerifiedKeyFrag -> bytes -> base64)
-    kfrags_b64 = [base64.b64encode(bytes(kfrag)).decode() for kfrag in kfrags]
+    # Serialize KFrags (VerifiedKeyFrag -> length-prefixed bytes -> base64)
+    kfrags_blob = pack_kfrags_blob(kfrags)
     
     # Store in Vault under transient path
-    store_secret_in_vault(vault, f"umbral/rekeys/{rekey_id}", {
+    await store_secret_in_vault(vault, f"umbral/rekeys/{rekey_id}", {
         "owner_id": request.owner_id,
         "recipient_id": request.recipient_id,
         "resource_id": request.resource_id,
         "expiry": request.expiry,
         "threshold": request.threshold,
         "shares": request.shares,
-        "kfrags": kfrags_b64,
+        "kfrags_blob": kfrags_blob,
         "owner_public_key": owner_data["public_key"],
         "owner_verifying_key": owner_data["verifying_key"],
         "recipient_public_key": recipient_data["public_key"],
@@ -384,56 +901,43 @@ async def perform_reencrypt(request: ReencryptRequest):
     Uses stored KFrags to transform a capsule for the recipient.
     Refuses to operate if the rekey has expired.
     
+    Request fields:
+    - rekey_id: ReKey ID from /rekey response
+    - capsule: Base64-encoded Umbral Capsule
+    - ciphertext: Base64-encoded ciphertext
+    
+    Response cfrags are base64-encoded CapsuleFragments; capsule and
+    ciphertext echo the originals (base64).
+    
     pyUmbral ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.reencrypt
     """
     vault = get_vault_client()
     
-    # Get rekey data from Vault
-    rekey_data = read_secret_from_vault(vault, f"umbral/rekeys/{request.rekey_id}")
-    if not rekey_data:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"ReKey {request.rekey_id} not found"
-        )
-    
-    # Check expiry
-    current_time = int(time.time())
-    if current_time > rekey_data["expiry"]:
-        # Clean up expired rekey
-        delete_secret_from_vault(vault, f"umbral/rekeys/{request.rekey_id}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"ReKey {request.rekey_id} has expired"
-        )
+    # Get rekey data from Vault (404 if missing, 403 if expired)
+    rekey_data = await get_active_rekey(vault, request.rekey_id)
     
     # Deserialize capsule
     try:
-        capsule_bytes = base64.b64decode(request.capsule)
-        capsule = Capsule.from_bytes(capsule_bytes)
+        capsule = await run_on_executor(capsule_from_b64, request.capsule)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid capsule format: {e}"
         )
     
-    # Deserialize KFrags and perform re-encryption
-    # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.VerifiedKeyFrag
-    cfrags = []
-    for kfrag_b64 in rekey_data["kfrags"]:
-        kfrag_bytes = base64.b64decode(kfrag_b64)
-        # Use from_verified_bytes since these were stored after verification
-        verified_kfrag = VerifiedKeyFrag.from_verified_bytes(kfrag_bytes)
-        
-        # Perform re-encryption
-        # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.reencrypt
-        cfrag = reencrypt(capsule=capsule, kfrag=verified_kfrag)
-        cfrags.append(cfrag)
+    # Deserialize KFrags (cached per rekey) and perform re-encryption
+    # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.reencrypt
+    cfrags = await asyncio.gather(*[
+        run_on_executor(reencrypt, capsule, verified_kfrag)
+        for verified_kfrag in await load_kfrags(request.rekey_id, rekey_data)
+    ])
     
     # Serialize CFrags
-    cfrags_b64 = [base64.b64encode(bytes(cfrag)).decode() for cfrag in cfrags]
+    cfrags_b64 = [binascii.b2a_base64(bytes(cfrag), newline=False).decode() for cfrag in cfrags]
     
     logger.info(f"Re-encryption performed for rekey {request.rekey_id}: generated {len(cfrags)} cfrags")
     
+    # capsule/ciphertext are echoed by reference, not re-encoded
     return ReencryptResponse(
         rekey_id=request.rekey_id,
         cfrags=cfrags_b64,
@@ -443,6 +947,73 @@ async def perform_reencrypt(request: ReencryptRequest):
     )
 
 
+@app.post("/reencrypt_batch", response_model=ReencryptBatchResponse)
+async def perform_reencrypt_batch(request: ReencryptBatchRequest):
+    """
+    POST /reencrypt_batch - Re-encrypt many capsules in one call
+    
+    Each distinct rekey_id is fetched from Vault once and its KFrags are
+    parsed once, then every capsule is re-encrypted with every KFrag of its
+    rekey. The whole batch fails (404/403/400) if any rekey is missing or
+    expired, or any capsule is malformed.
+    
+    Request fields:
+    - items: list of {rekey_id, capsule (base64)}, at most 256
+    
+    Response results carry the input index, rekey_id and base64 cfrags
+    for each item, in input order.
+    
+    pyUmbral ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.reencrypt
+    """
+    vault = get_vault_client()
+    
+    # Fetch each distinct rekey once, concurrently
+    rekey_ids = list(dict.fromkeys(item.rekey_id for item in request.items))
+    rekeys = await asyncio.gather(*[get_active_rekey(vault, r) for r in rekey_ids])
+    kfrag_lists = await asyncio.gather(*[
+        load_kfrags(rekey_id, rekey_data) for rekey_id, rekey_data in zip(rekey_ids, rekeys)
+    ])
+    kfrags_by_rekey = dict(zip(rekey_ids, kfrag_lists))
+    
+    # Deserialize capsules on the thread pool; report the first bad index
+    capsules = await asyncio.gather(
+        *[run_on_executor(capsule_from_b64, item.capsule) for item in request.items],
+        return_exceptions=True,
+    )
+    for index, capsule in enumerate(capsules):
+        if isinstance(capsule, Exception):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid capsule format at index {index}: {capsule}"
+            )
+    
+    # Re-encrypt every (capsule, kfrag) pair on the thread pool
+    futures = [
+        [
+            run_on_executor(reencrypt, capsule, verified_kfrag)
+            for verified_kfrag in kfrags_by_rekey[item.rekey_id]
+        ]
+        for item, capsule in zip(request.items, capsules)
+    ]
+    cfrags_per_item = await asyncio.gather(*[asyncio.gather(*f) for f in futures])
+    
+    results = [
+        ReencryptBatchResult(
+            index=index,
+            rekey_id=item.rekey_id,
+            cfrags=[binascii.b2a_base64(bytes(cfrag), newline=False).decode() for cfrag in cfrags],
+        )
+        for index, (item, cfrags) in enumerate(zip(request.items, cfrags_per_item))
+    ]
+    
+    logger.info(f"Batch re-encryption performed: {len(results)} capsules across {len(rekey_ids)} rekeys")
+    
+    return ReencryptBatchResponse(
+        results=results,
+        message=f"Batch re-encryption successful. {len(results)} capsules re-encrypted."
+    )
+
+
 # ============================================================================
 # Additional utility endpoints for testing
 # ============================================================================
@@ -473,19 +1044,18 @@ async def encrypt_data(request: EncryptRequest):
     vault = get_vault_client()
     
     # Get owner's public key
-    owner_data = read_secret_from_vault(vault, f"umbral/owners/{request.owner_id}")
+    owner_data = await get_owner_pubkeys(vault, request.owner_id)
     if not owner_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Owner {request.owner_id} not found"
         )
     
-    from umbral import PublicKey
-    delegating_pk = PublicKey.from_bytes(bytes.fromhex(owner_data["public_key"]))
+    delegating_pk, _ = await load_owner_public_keys(request.owner_id, owner_data)
     
     # Decrypt base64 plaintext
     try:
-        plaintext = base64.b64decode(request.plaintext)
+        plaintext = binascii.a2b_base64(request.plaintext)
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -494,11 +1064,11 @@ async def encrypt_data(request: EncryptRequest):
     
     # Encrypt
     # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.encrypt
-    capsule, ciphertext = encrypt(delegating_pk, plaintext)
+    capsule, ciphertext = await run_on_executor(encrypt, delegating_pk, plaintext)
     
     return EncryptResponse(
-        capsule=base64.b64encode(bytes(capsule)).decode(),
-        ciphertext=base64.b64encode(ciphertext).decode(),
+        capsule=binascii.b2a_base64(bytes(capsule), newline=False).decode(),
+        ciphertext=binascii.b2a_base64(ciphertext, newline=False).decode(),
         message="Data encrypted successfully"
     )
 
@@ -510,6 +1080,10 @@ class DecryptRequest(BaseModel):
     capsule: str
     ciphertext: str
     cfrags: list[str] = Field(..., description="Base64-encoded CapsuleFragments from /reencrypt")
+    trusted_cfrags: bool = Field(
+        default=False,
+        description="Skip cfrag verification; only for cfrags taken directly from this service's /reencrypt"
+    )
 
 
 class DecryptResponse(BaseModel):
@@ -526,20 +1100,27 @@ async def decrypt_reencrypted_data(request: DecryptRequest):
     This is a utility endpoint for testing. In production, decryption
     would typically happen client-side with the recipient's private key.
     
+    If trusted_cfrags is true, the cfrags are taken as already verified
+    (VerifiedCapsuleFrag.from_verified_bytes) and the per-cfrag verify()
+    is skipped. This is only safe when the cfrags come straight from this
+    service's own /reencrypt, which produces them from verified KFrags;
+    cfrags from any other source must go through verification.
+    
     pyUmbral ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.decrypt_reencrypted
     """
     vault = get_vault_client()
     
-    # Get recipient's private key
-    recipient_data = read_secret_from_vault(vault, f"umbral/owners/{request.recipient_id}")
+    # Get recipient's private key (uncached) and owner's public keys (cached)
+    # concurrently
+    recipient_data, owner_data = await asyncio.gather(
+        read_secret_from_vault(vault, f"umbral/owners/{request.recipient_id}"),
+        get_owner_pubkeys(vault, request.owner_id),
+    )
     if not recipient_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recipient {request.recipient_id} not found"
         )
-    
-    # Get owner's public keys for verification
-    owner_data = read_secret_from_vault(vault, f"umbral/owners/{request.owner_id}")
     if not owner_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -547,17 +1128,16 @@ async def decrypt_reencrypted_data(request: DecryptRequest):
         )
     
     # Reconstruct keys
-    receiving_sk = SecretKey.from_bytes(bytes.fromhex(recipient_data["delegating_secret_key"]))
-    
-    from umbral import PublicKey
-    delegating_pk = PublicKey.from_bytes(bytes.fromhex(owner_data["public_key"]))
-    verifying_pk = PublicKey.from_bytes(bytes.fromhex(owner_data["verifying_key"]))
-    receiving_pk = PublicKey.from_bytes(bytes.fromhex(recipient_data["public_key"]))
+    receiving_sk, (delegating_pk, verifying_pk), (receiving_pk, _) = await asyncio.gather(
+        run_on_executor(decode_secret_key, recipient_data["delegating_secret_key"]),
+        load_owner_public_keys(request.owner_id, owner_data),
+        load_owner_public_keys(request.recipient_id, recipient_data),
+    )
     
     # Deserialize capsule and ciphertext
     try:
-        capsule = Capsule.from_bytes(base64.b64decode(request.capsule))
-        ciphertext = base64.b64decode(request.ciphertext)
+        capsule = await run_on_executor(capsule_from_b64, request.capsule)
+        ciphertext = binascii.a2b_base64(request.ciphertext)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -565,24 +1145,28 @@ async def decrypt_reencrypted_data(request: DecryptRequest):
         )
     
     # Deserialize and verify CFrags
-    # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.CapsuleFrag
-    verified_cfrags = []
-    for cfrag_b64 in request.cfrags:
-        cfrag_bytes = base64.b64decode(cfrag_b64)
-        cfrag = CapsuleFrag.from_bytes(cfrag_bytes)
-        
-        # Verify the cfrag
-        verified_cfrag = cfrag.verify(
-            capsule=capsule,
-            verifying_pk=verifying_pk,
-            delegating_pk=delegating_pk,
-            receiving_pk=receiving_pk
+    # Trusted cfrags come from our own /reencrypt and skip verify()
+    try:
+        cfrags = await run_on_executor(decode_cfrags, request.cfrags, request.trusted_cfrags)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid cfrag format: {e}"
         )
-        verified_cfrags.append(verified_cfrag)
+    
+    if request.trusted_cfrags:
+        verified_cfrags = cfrags
+    else:
+        # Verify the cfrags in parallel
+        verified_cfrags = await asyncio.gather(*[
+            run_on_executor(cfrag.verify, capsule, verifying_pk, delegating_pk, receiving_pk)
+            for cfrag in cfrags
+        ])
     
     # Decrypt
     # Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.decrypt_reencrypted
-    plaintext = decrypt_reencrypted(
+    plaintext = await run_on_executor(
+        decrypt_reencrypted,
         receiving_sk=receiving_sk,
         delegating_pk=delegating_pk,
         capsule=capsule,
@@ -591,11 +1175,22 @@ async def decrypt_reencrypted_data(request: DecryptRequest):
     )
     
     return DecryptResponse(
-        plaintext=base64.b64encode(plaintext).decode(),
+        plaintext=binascii.b2a_base64(plaintext, newline=False).decode(),
         message="Decryption successful"
     )
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple worker processes (one per core by default) so CPU-bound EC work
+    # is not capped by a single interpreter; caches and the Vault pool are
+    # per-worker, and the app must be passed as an import string for workers
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("PYUMBRAL_WORKERS", os.cpu_count() or 1)),
+        # uvloop event loop + httptools parser; uvloop has no Windows support
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
@@ -141,7 +141,9 @@ if [ ! -f "${PYUMBRAL_PID_FILE}" ]; then
     export VAULT_ADDR="http://127.0.0.1:8200"
     export VAULT_TOKEN="dev-root-token"
     
-    nohup uvicorn app:app --host 0.0.0.0 --port 8000 > "${PYUMBRAL_LOG}" 2>&1 &
+    # One worker process per core unless PYUMBRAL_WORKERS is set
+    PYUMBRAL_WORKERS="${PYUMBRAL_WORKERS:-$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 1)}"
+    nohup uvicorn app:app --host 0.0.0.0 --port 8000 --workers "${PYUMBRAL_WORKERS}" --loop uvloop --http httptools > "${PYUMBRAL_LOG}" 2>&1 &
     echo $! > "${PYUMBRAL_PID_FILE}"
     
     log_info "pyUmbral started (PID $(cat ${PYUMBRAL_PID_FILE}))"
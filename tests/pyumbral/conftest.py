@@ -0,0 +1,48 @@
+"""
+Shared pytest fixtures for the pyUmbral tests.
+
+Fixtures are session-scoped so keys and encryptions are
+generated once rather than per test (once per worker when run under
+pytest-xdist). They are read-only; tests must not mutate them.
+
+Official Documentation References:
+  - pyUmbral API: https://pyumbral.readthedocs.io/en/latest/api.html
+"""
+
+import pytest
+
+from umbral import SecretKey, Signer, encrypt
+
+
+# Keys are read-only in every test, so generate them once per session
+@pytest.fixture(scope="session")
+def alice_keys():
+    """Generate Alice's (owner) key pairs"""
+    delegating_sk = SecretKey.random()
+    delegating_pk = delegating_sk.public_key()
+    signing_sk = SecretKey.random()
+    signer = Signer(signing_sk)
+    verifying_key = signing_sk.public_key()
+    return {
+        "delegating_sk": delegating_sk,
+        "delegating_pk": delegating_pk,
+        "signing_sk": signing_sk,
+        "signer": signer,
+        "verifying_key": verifying_key
+    }
+
+
+@pytest.fixture(scope="session")
+def bob_keys():
+    """Generate Bob's (recipient) key pairs"""
+    sk = SecretKey.random()
+    pk = sk.public_key()
+    return {"sk": sk, "pk": pk}
+
+
+@pytest.fixture(scope="session")
+def encrypted_blob(alice_keys):
+    """Encrypt one message to Alice's key, shared by tests that only read it"""
+    plaintext = b"Secret message for Bob"
+    capsule, ciphertext = encrypt(alice_keys["delegating_pk"], plaintext)
+    return {"plaintext": plaintext, "capsule": capsule, "ciphertext": ciphertext}
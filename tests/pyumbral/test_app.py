@@ -0,0 +1,330 @@
+"""
+pyUmbral FastAPI Service Tests
+
+Exercises the service endpoints in pyumbral-service/app.py against an
+in-memory fake Vault (httpx.MockTransport), so no Vault server is needed.
+
+Official Documentation References:
+  - FastAPI Testing: https://fastapi.tiangolo.com/tutorial/testing/
+  - HTTPX Mock Transport: https://www.python-httpx.org/advanced/transports/#mock-transports
+  - Vault KV v2 API: https://developer.hashicorp.com/vault/api-docs/secret/kv/kv-v2
+
+Run with: pytest tests/pyumbral/test_app.py -v
+"""
+
+import os
+import sys
+import asyncio
+import json
+import base64
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from umbral import generate_kfrags
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "pyumbral-service"))
+
+import app as service  # noqa: E402
+
+
+class FakeVault:
+    """KV v2 data/metadata endpoints over a dict, recording every request"""
+
+    def __init__(self):
+        self.store = {}
+        self.calls = []
+
+    def reads(self, path):
+        """Number of GETs issued for one secret path"""
+        return self.calls.count(("GET", f"/v1/{service.VAULT_KV_MOUNT}/data/{path}"))
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path))
+        data_prefix = f"/v1/{service.VAULT_KV_MOUNT}/data/"
+        metadata_prefix = f"/v1/{service.VAULT_KV_MOUNT}/metadata/"
+        if request.url.path.startswith(data_prefix):
+            path = request.url.path[len(data_prefix):]
+            if request.method == "POST":
+                self.store[path] = json.loads(request.content)["data"]
+                return httpx.Response(200, json={})
+            if path in self.store:
+                return httpx.Response(200, json={"data": {"data": self.store[path]}})
+            return httpx.Response(404, json={"errors": []})
+        if request.url.path.startswith(metadata_prefix) and request.method == "DELETE":
+            self.store.pop(request.url.path[len(metadata_prefix):], None)
+            return httpx.Response(204)
+        return httpx.Response(404, json={"errors": []})
+
+
+@pytest.fixture(scope="module")
+def fake_vault():
+    return FakeVault()
+
+
+@pytest.fixture(scope="module")
+def client(fake_vault):
+    """TestClient with the pooled Vault client swapped for the fake, owners prepared"""
+    with TestClient(service.app) as test_client:
+        real_vault = service.VAULT
+        service.VAULT = httpx.AsyncClient(
+            base_url="http://vault", transport=httpx.MockTransport(fake_vault.handler)
+        )
+        for owner_id in ("alice", "bob"):
+            assert test_client.post("/prepare", json={"owner_id": owner_id}).status_code == 200
+        yield test_client
+        service.VAULT = real_vault
+
+
+@pytest.fixture(scope="module")
+def kfrags(alice_keys, bob_keys):
+    """Three Alice -> Bob kfrags (2-of-3)"""
+    return generate_kfrags(
+        delegating_sk=alice_keys["delegating_sk"],
+        receiving_pk=bob_keys["pk"],
+        signer=alice_keys["signer"],
+        threshold=2,
+        shares=3
+    )
+
+
+def _rekey(client, resource_id, threshold=1, shares=1):
+    response = client.post("/rekey", json={
+        "owner_id": "alice",
+        "recipient_id": "bob",
+        "resource_id": resource_id,
+        "expiry": int(time.time()) + 3600,
+        "threshold": threshold,
+        "shares": shares,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["rekey_id"]
+
+
+def _capsule(client, plaintext=b"batch"):
+    response = client.post("/encrypt", json={
+        "owner_id": "alice", "plaintext": base64.b64encode(plaintext).decode()
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+class TestReencryptBatch:
+    """Test POST /reencrypt_batch"""
+
+    def test_results_in_input_order(self, client):
+        """Each result carries its input index and rekey_id, in request order"""
+        rekey_a = _rekey(client, "order-a", threshold=2, shares=2)
+        rekey_b = _rekey(client, "order-b")
+        encrypted = [_capsule(client, bytes([i]) * 8) for i in range(3)]
+        rekey_ids = [rekey_a, rekey_b, rekey_a]
+
+        response = client.post("/reencrypt_batch", json={"items": [
+            {"rekey_id": r, "capsule": e["capsule"]} for r, e in zip(rekey_ids, encrypted)
+        ]})
+        assert response.status_code == 200, response.text
+        results = response.json()["results"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert [r["rekey_id"] for r in results] == rekey_ids
+        assert [len(r["cfrags"]) for r in results] == [2, 1, 2]
+
+        # The cfrags of the last item decrypt its own ciphertext
+        decrypted = client.post("/decrypt", json={
+            "recipient_id": "bob",
+            "owner_id": "alice",
+            "capsule": encrypted[2]["capsule"],
+            "ciphertext": encrypted[2]["ciphertext"],
+            "cfrags": results[2]["cfrags"],
+        })
+        assert decrypted.status_code == 200, decrypted.text
+        assert base64.b64decode(decrypted.json()["plaintext"]) == bytes([2]) * 8
+
+    def test_duplicate_rekey_read_once(self, client, fake_vault):
+        """A rekey_id repeated across items is fetched from Vault only once"""
+        rekey_id = _rekey(client, "dedupe")
+        capsule = _capsule(client)["capsule"]
+        reads_before = fake_vault.reads(f"umbral/rekeys/{rekey_id}")
+
+        response = client.post("/reencrypt_batch", json={
+            "items": [{"rekey_id": rekey_id, "capsule": capsule}] * 3
+        })
+        assert response.status_code == 200, response.text
+        assert fake_vault.reads(f"umbral/rekeys/{rekey_id}") - reads_before == 1
+
+    def test_missing_rekey_not_found(self, client):
+        capsule = _capsule(client)["capsule"]
+        response = client.post("/reencrypt_batch", json={
+            "items": [{"rekey_id": "missing-rekey", "capsule": capsule}]
+        })
+        assert response.status_code == 404
+
+    def test_expired_rekey_forbidden(self, client, fake_vault):
+        fake_vault.store["umbral/rekeys/expired-rekey"] = {"expiry": int(time.time()) - 60}
+        capsule = _capsule(client)["capsule"]
+        response = client.post("/reencrypt_batch", json={
+            "items": [{"rekey_id": "expired-rekey", "capsule": capsule}]
+        })
+        assert response.status_code == 403
+
+    def test_malformed_capsule_reports_index(self, client):
+        rekey_id = _rekey(client, "malformed")
+        capsule = _capsule(client)["capsule"]
+        response = client.post("/reencrypt_batch", json={"items": [
+            {"rekey_id": rekey_id, "capsule": capsule},
+            {"rekey_id": rekey_id, "capsule": "bm90IGEgY2Fwc3VsZQ=="},
+        ]})
+        assert response.status_code == 400
+        assert "index 1" in response.json()["detail"]
+
+    def test_batch_size_bounds(self, client):
+        item = {"rekey_id": "any", "capsule": "any"}
+        assert client.post("/reencrypt_batch", json={"items": []}).status_code == 422
+        assert client.post("/reencrypt_batch", json={"items": [item] * 257}).status_code == 422
+
+
+class TestDecrypt:
+    """Test POST /reencrypt -> POST /decrypt"""
+
+    def _reencrypted(self, client, plaintext):
+        rekey_id = _rekey(client, "decrypt", threshold=2, shares=3)
+        response = _capsule(client, plaintext)
+        encrypted = {"capsule": response["capsule"], "ciphertext": response["ciphertext"]}
+        response = client.post("/reencrypt", json={"rekey_id": rekey_id, **encrypted})
+        assert response.status_code == 200, response.text
+        return encrypted, response.json()["cfrags"]
+
+    @pytest.mark.parametrize("trusted_cfrags", [False, True])
+    def test_roundtrip(self, client, trusted_cfrags):
+        """Both the verified and the trusted_cfrags paths recover the plaintext"""
+        encrypted, cfrags = self._reencrypted(client, b"pre key")
+        response = client.post("/decrypt", json={
+            "recipient_id": "bob",
+            "owner_id": "alice",
+            "cfrags": cfrags,
+            "trusted_cfrags": trusted_cfrags,
+            **encrypted,
+        })
+        assert response.status_code == 200, response.text
+        assert base64.b64decode(response.json()["plaintext"]) == b"pre key"
+
+    @pytest.mark.parametrize("trusted_cfrags", [False, True])
+    def test_malformed_cfrag_rejected(self, client, trusted_cfrags):
+        encrypted, _ = self._reencrypted(client, b"pre key")
+        response = client.post("/decrypt", json={
+            "recipient_id": "bob",
+            "owner_id": "alice",
+            "cfrags": ["!!!"],
+            "trusted_cfrags": trusted_cfrags,
+            **encrypted,
+        })
+        assert response.status_code == 400
+        assert "cfrag" in response.json()["detail"]
+
+
+class TestKFragsStorage:
+    """Test the Vault encoding of rekey kfrags"""
+
+    def test_blob_roundtrip(self, kfrags):
+        """pack_kfrags_blob() -> unpack_kfrags_blob() returns every kfrag in order"""
+        blob = service.pack_kfrags_blob(kfrags)
+        assert list(service.unpack_kfrags_blob(blob)) == [bytes(k) for k in kfrags]
+
+    def test_decode_kfrags_from_blob(self, kfrags):
+        rekey_data = {"expiry": int(time.time()) + 3600, "kfrags_blob": service.pack_kfrags_blob(kfrags)}
+        loaded = service.decode_kfrags(rekey_data)
+        assert [bytes(k) for k in loaded] == [bytes(k) for k in kfrags]
+
+    def test_decode_kfrags_legacy_list(self, kfrags):
+        """Rekeys stored before kfrags_blob keep a list of base64 kfrags"""
+        rekey_data = {
+            "expiry": int(time.time()) + 3600,
+            "kfrags": [base64.b64encode(bytes(k)).decode() for k in kfrags],
+        }
+        loaded = service.decode_kfrags(rekey_data)
+        assert [bytes(k) for k in loaded] == [bytes(k) for k in kfrags]
+
+
+class TestSecretKeyDecoding:
+    """Test decode_secret_key() on both stored encodings"""
+
+    def test_decode_base64(self, alice_keys):
+        sk_bytes = alice_keys["delegating_sk"].to_secret_bytes()
+        decoded = service.decode_secret_key(base64.b64encode(sk_bytes).decode())
+        assert decoded.to_secret_bytes() == sk_bytes
+
+    def test_decode_legacy_hex(self, alice_keys):
+        """Owners prepared before the base64 change have hex-encoded keys"""
+        sk_bytes = alice_keys["delegating_sk"].to_secret_bytes()
+        decoded = service.decode_secret_key(sk_bytes.hex())
+        assert decoded.to_secret_bytes() == sk_bytes
+
+
+class TestRekeyIds:
+    """Test new_rekey_id() formatting and ordering"""
+
+    def test_length_and_alphabet(self):
+        rekey_id = service.new_rekey_id()
+        assert len(rekey_id) == 26
+        assert set(rekey_id) <= set("0123456789abcdefghijklmnopqrstuv")
+
+    def test_sorted_by_creation_time(self, monkeypatch):
+        """IDs created later sort after earlier ones, across timestamp byte boundaries"""
+        rekey_ids = []
+        for ms in (1_700_000_000_000, 1_700_000_000_001, 1_700_000_000_255,
+                   1_700_000_000_256, 1_700_000_065_536, 1_800_000_000_000):
+            monkeypatch.setattr(service.time, "time", lambda ms=ms: (ms + 0.5) / 1000)
+            rekey_ids.append(service.new_rekey_id())
+        assert rekey_ids == sorted(rekey_ids)
+        assert len(set(rekey_ids)) == len(rekey_ids)
+
+
+class TestPurgeLock:
+    """Test acquire_purge_lock()"""
+
+    def test_unwritable_lock_path_disables_purge(self, monkeypatch, tmp_path):
+        """An unopenable lock file skips the purge instead of failing startup"""
+        monkeypatch.setattr(service, "REKEY_PURGE_LOCK", str(tmp_path / "missing" / "purge.lock"))
+        assert service.acquire_purge_lock() is None
+
+    def test_lock_held_by_one_holder(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(service, "REKEY_PURGE_LOCK", str(tmp_path / "purge.lock"))
+        first = service.acquire_purge_lock()
+        try:
+            assert first is not None
+            if service.fcntl is not None:
+                assert service.acquire_purge_lock() is None
+        finally:
+            first.close()
+
+
+class TestHealth:
+    """Test GET /health Vault probe caching"""
+
+    @pytest.fixture
+    def probe_calls(self, monkeypatch):
+        """Count Vault token checks; fresh health cache per test"""
+        calls = []
+
+        async def fake_checked():
+            calls.append(time.monotonic())
+            await asyncio.sleep(0)
+
+        monkeypatch.setattr(service, "get_vault_client_checked", fake_checked)
+        monkeypatch.setattr(service, "_HEALTH_CACHE", {"ts": float("-inf"), "ok": False, "probe": None})
+        return calls
+
+    def test_concurrent_probes_share_one_vault_call(self, probe_calls):
+        async def burst():
+            return await asyncio.gather(*[service.health_check() for _ in range(10)])
+
+        responses = asyncio.run(burst())
+        assert len(probe_calls) == 1
+        assert all(r.vault_connected for r in responses)
+
+    def test_first_probe_soon_after_boot(self, probe_calls, monkeypatch):
+        """time.monotonic() near zero must not be mistaken for a fresh cache entry"""
+        monkeypatch.setattr(service.time, "monotonic", lambda: 0.5)
+        response = asyncio.run(service.health_check())
+        assert len(probe_calls) == 1
+        assert response.status == "healthy"
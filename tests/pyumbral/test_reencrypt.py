@@ -11,11 +11,17 @@ Official Documentation References:
   - pyUmbral Usage Guide: https://pyumbral.readthedocs.io/en/latest/using_pyumbral.html
 
 Run with: pytest tests/pyumbral/test_reencrypt.py -v
+Parallel (pytest-xdist, one test class per worker):
+    pytest tests/pyumbral/test_reencrypt.py -n auto --dist=loadscope
+
+Shared key/encryption fixtures live in tests/pyumbral/conftest.py.
 """
 
+import os
 import pytest
 import base64
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # pyUmbral imports (per https://pyumbral.readthedocs.io/en/latest/api.html)
 from umbral import (
@@ -32,9 +38,32 @@ from umbral import (
     generate_kfrags,
     reencrypt,
     decrypt_reencrypted,
+    VerificationError,
 )
 
 
+# Serialized sizes are constant for a given pyUmbral version
+_SK_SZ = SecretKey.serialized_size()
+_PK_SZ = PublicKey.serialized_size()
+_CAP_SZ = Capsule.serialized_size()
+_VKF_SZ = VerifiedKeyFrag.serialized_size()
+
+# reencrypt() calls for different kfrags are independent; run them on threads
+# (pyUmbral's native EC code releases the GIL, and no pickling is needed)
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def _decrypt(sk, dpk, cap, cfrags, ct, /):
+    """decrypt_reencrypted() with positional args, for the tests' common call"""
+    return decrypt_reencrypted(
+        receiving_sk=sk,
+        delegating_pk=dpk,
+        capsule=cap,
+        verified_cfrags=cfrags,
+        ciphertext=ct
+    )
+
+
 class TestUmbralKeyGeneration:
     """Test key generation functionality"""
     
@@ -48,7 +77,7 @@ class TestUmbralKeyGeneration:
         
         # Serialize and deserialize
         sk_bytes = sk.to_secret_bytes()
-        assert len(sk_bytes) == SecretKey.serialized_size()
+        assert len(sk_bytes) == _SK_SZ
         
         sk_restored = SecretKey.from_bytes(sk_bytes)
         assert sk_restored is not None
@@ -64,7 +93,7 @@ class TestUmbralKeyGeneration:
         
         # Serialize and deserialize
         pk_bytes = bytes(pk)
-        assert len(pk_bytes) == PublicKey.serialized_size()
+        assert len(pk_bytes) == _PK_SZ
         
         pk_restored = PublicKey.from_bytes(pk_bytes)
         assert pk_restored == pk
@@ -91,41 +120,35 @@ class TestUmbralKeyGeneration:
 class TestUmbralEncryption:
     """Test encryption and decryption functionality"""
     
-    def test_encrypt_decrypt_original(self):
+    def test_encrypt_decrypt_original(self, alice_keys, encrypted_blob):
         """
         Test basic encrypt/decrypt_original roundtrip (no re-encryption).
         Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.encrypt
         Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.decrypt_original
         """
-        # Generate Alice's key pair
-        alice_sk = SecretKey.random()
-        alice_pk = alice_sk.public_key()
-        
-        # Encrypt data
-        plaintext = b"Hello, Proxy Re-Encryption!"
-        capsule, ciphertext = encrypt(alice_pk, plaintext)
+        # Data encrypted with Alice's public key (encrypted_blob fixture)
+        plaintext = encrypted_blob["plaintext"]
+        capsule = encrypted_blob["capsule"]
+        ciphertext = encrypted_blob["ciphertext"]
         
         assert capsule is not None
         assert ciphertext is not None
         assert ciphertext != plaintext
         
         # Decrypt with Alice's secret key
-        decrypted = decrypt_original(alice_sk, capsule, ciphertext)
+        decrypted = decrypt_original(alice_keys["delegating_sk"], capsule, ciphertext)
         assert decrypted == plaintext
     
-    def test_capsule_serialization(self):
+    def test_capsule_serialization(self, encrypted_blob):
         """
         Test Capsule serialization/deserialization.
         Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.Capsule
         """
-        alice_sk = SecretKey.random()
-        alice_pk = alice_sk.public_key()
-        
-        capsule, ciphertext = encrypt(alice_pk, b"test data")
+        capsule = encrypted_blob["capsule"]
         
         # Serialize
         capsule_bytes = bytes(capsule)
-        assert len(capsule_bytes) == Capsule.serialized_size()
+        assert len(capsule_bytes) == _CAP_SZ
         
         # Deserialize
         capsule_restored = Capsule.from_bytes(capsule_bytes)
@@ -135,29 +158,6 @@ class TestUmbralEncryption:
 class TestUmbralReencryption:
     """Test the complete re-encryption flow"""
     
-    @pytest.fixture
-    def alice_keys(self):
-        """Generate Alice's (owner) key pairs"""
-        delegating_sk = SecretKey.random()
-        delegating_pk = delegating_sk.public_key()
-        signing_sk = SecretKey.random()
-        signer = Signer(signing_sk)
-        verifying_key = signing_sk.public_key()
-        return {
-            "delegating_sk": delegating_sk,
-            "delegating_pk": delegating_pk,
-            "signing_sk": signing_sk,
-            "signer": signer,
-            "verifying_key": verifying_key
-        }
-    
-    @pytest.fixture
-    def bob_keys(self):
-        """Generate Bob's (recipient) key pairs"""
-        sk = SecretKey.random()
-        pk = sk.public_key()
-        return {"sk": sk, "pk": pk}
-    
     def test_generate_kfrags(self, alice_keys, bob_keys):
         """
         Test KFrag generation.
@@ -194,20 +194,19 @@ class TestUmbralReencryption:
         
         # Serialize VerifiedKeyFrag
         kfrag_bytes = bytes(kfrag)
-        assert len(kfrag_bytes) == VerifiedKeyFrag.serialized_size()
+        assert len(kfrag_bytes) == _VKF_SZ
         
         # Deserialize using from_verified_bytes (trusted source)
         kfrag_restored = VerifiedKeyFrag.from_verified_bytes(kfrag_bytes)
         assert kfrag_restored is not None
     
-    def test_reencrypt(self, alice_keys, bob_keys):
+    def test_reencrypt(self, alice_keys, bob_keys, encrypted_blob):
         """
         Test capsule re-encryption.
         Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.reencrypt
         """
-        # Encrypt data with Alice's public key
-        plaintext = b"Secret message for Bob"
-        capsule, ciphertext = encrypt(alice_keys["delegating_pk"], plaintext)
+        # Data encrypted with Alice's public key
+        capsule = encrypted_blob["capsule"]
         
         # Generate kfrags
         kfrags = generate_kfrags(
@@ -219,15 +218,14 @@ class TestUmbralReencryption:
         )
         
         # Perform re-encryption (simulating Ursula proxies)
-        cfrags = []
-        for kfrag in kfrags[:2]:  # Use threshold number of kfrags
-            cfrag = reencrypt(capsule=capsule, kfrag=kfrag)
+        # Use threshold number of kfrags
+        cfrags = list(_POOL.map(lambda kf: reencrypt(capsule=capsule, kfrag=kf), kfrags[:2]))
+        for cfrag in cfrags:
             assert isinstance(cfrag, VerifiedCapsuleFrag)
-            cfrags.append(cfrag)
         
         assert len(cfrags) == 2
     
-    def test_full_roundtrip(self, alice_keys, bob_keys):
+    def test_full_roundtrip(self, alice_keys, bob_keys, encrypted_blob):
         """
         Test the complete encrypt → rekey → reencrypt → decrypt roundtrip.
         
@@ -241,9 +239,10 @@ class TestUmbralReencryption:
           - https://pyumbral.readthedocs.io/en/latest/using_pyumbral.html
           - https://github.com/nucypher/pyUmbral
         """
-        # Step 1: Alice encrypts data
-        plaintext = b"Highly confidential healthcare data"
-        capsule, ciphertext = encrypt(alice_keys["delegating_pk"], plaintext)
+        # Step 1: Alice encrypts data (shared encrypted_blob fixture)
+        plaintext = encrypted_blob["plaintext"]
+        capsule = encrypted_blob["capsule"]
+        ciphertext = encrypted_blob["ciphertext"]
         
         # Verify Alice can decrypt her own data
         alice_decrypted = decrypt_original(
@@ -264,36 +263,28 @@ class TestUmbralReencryption:
         
         # Step 3: Proxies perform re-encryption
         # In production, different Ursulas would each hold one kfrag
-        cfrags = []
-        for kfrag in kfrags[:2]:  # Only need threshold (2) kfrags
-            cfrag = reencrypt(capsule=capsule, kfrag=kfrag)
-            cfrags.append(cfrag)
+        # Only need threshold (2) kfrags
+        cfrags = list(_POOL.map(lambda kf: reencrypt(capsule=capsule, kfrag=kf), kfrags[:2]))
         
         # Step 4: Bob decrypts using re-encrypted capsule fragments
-        bob_decrypted = decrypt_reencrypted(
-            receiving_sk=bob_keys["sk"],
-            delegating_pk=alice_keys["delegating_pk"],
-            capsule=capsule,
-            verified_cfrags=cfrags,
-            ciphertext=ciphertext
-        )
+        bob_decrypted = _decrypt(bob_keys["sk"], alice_keys["delegating_pk"], capsule, cfrags, ciphertext)
         
         assert bob_decrypted == plaintext
     
-    def test_roundtrip_with_serialization(self, alice_keys, bob_keys):
+    def test_roundtrip_with_serialization(self, alice_keys, bob_keys, encrypted_blob):
         """
         Test roundtrip with serialization at each step.
         
         This simulates a real-world scenario where data is serialized
         for storage/transmission between each step.
         """
-        # Encrypt
-        plaintext = b"Test data with serialization"
-        capsule, ciphertext = encrypt(alice_keys["delegating_pk"], plaintext)
+        # Encrypted data (shared encrypted_blob fixture)
+        plaintext = encrypted_blob["plaintext"]
+        capsule = encrypted_blob["capsule"]
+        ciphertext = encrypted_blob["ciphertext"]
         
-        # Serialize capsule and ciphertext (as would be stored in IPFS)
-        capsule_b64 = base64.b64encode(bytes(capsule)).decode()
-        ciphertext_b64 = base64.b64encode(ciphertext).decode()
+        # Serialize capsule (as would be stored in IPFS)
+        capsule_bytes = bytes(capsule)
         
         # Generate and serialize kfrags (as would be stored in Vault)
         kfrags = generate_kfrags(
@@ -303,18 +294,19 @@ class TestUmbralReencryption:
             threshold=1,
             shares=1
         )
-        kfrag_b64 = base64.b64encode(bytes(kfrags[0])).decode()
+        kfrag_bytes = bytes(kfrags[0])
         
         # Simulate proxy re-encryption (deserialize, reencrypt, serialize)
-        capsule_restored = Capsule.from_bytes(base64.b64decode(capsule_b64))
-        kfrag_restored = VerifiedKeyFrag.from_verified_bytes(
-            base64.b64decode(kfrag_b64)
-        )
+        capsule_restored = Capsule.from_bytes(capsule_bytes)
+        kfrag_restored = VerifiedKeyFrag.from_verified_bytes(kfrag_bytes)
         cfrag = reencrypt(capsule=capsule_restored, kfrag=kfrag_restored)
+        
+        # Send the cfrag over the wire as base64 (as /reencrypt does)
         cfrag_b64 = base64.b64encode(bytes(cfrag)).decode()
+        cfrag_bytes = base64.b64decode(cfrag_b64)
+        assert cfrag_bytes == bytes(cfrag)
         
         # Deserialize and decrypt
-        cfrag_bytes = base64.b64decode(cfrag_b64)
         cfrag_restored = CapsuleFrag.from_bytes(cfrag_bytes)
         
         # Verify cfrag before decryption
@@ -326,26 +318,22 @@ class TestUmbralReencryption:
         )
         
         # Decrypt
-        ciphertext_restored = base64.b64decode(ciphertext_b64)
-        bob_decrypted = decrypt_reencrypted(
-            receiving_sk=bob_keys["sk"],
-            delegating_pk=alice_keys["delegating_pk"],
-            capsule=capsule_restored,
-            verified_cfrags=[verified_cfrag],
-            ciphertext=ciphertext_restored
+        bob_decrypted = _decrypt(
+            bob_keys["sk"], alice_keys["delegating_pk"], capsule_restored, [verified_cfrag], ciphertext
         )
         
         assert bob_decrypted == plaintext
     
-    def test_threshold_requirement(self, alice_keys, bob_keys):
+    def test_threshold_requirement(self, alice_keys, bob_keys, encrypted_blob):
         """
         Test that threshold number of cfrags is required for decryption.
         
         With threshold=3 and shares=5, we need at least 3 cfrags to decrypt.
         """
-        # Encrypt
-        plaintext = b"Threshold test data"
-        capsule, ciphertext = encrypt(alice_keys["delegating_pk"], plaintext)
+        # Encrypted data (shared encrypted_blob fixture)
+        plaintext = encrypted_blob["plaintext"]
+        capsule = encrypted_blob["capsule"]
+        ciphertext = encrypted_blob["ciphertext"]
         
         # Generate kfrags with higher threshold
         kfrags = generate_kfrags(
@@ -357,42 +345,29 @@ class TestUmbralReencryption:
         )
         
         # Re-encrypt with exactly threshold cfrags
-        cfrags = [reencrypt(capsule=capsule, kfrag=kfrag) for kfrag in kfrags[:3]]
+        cfrags = list(_POOL.map(lambda kf: reencrypt(capsule=capsule, kfrag=kf), kfrags[:3]))
         
         # Should succeed with threshold cfrags
-        decrypted = decrypt_reencrypted(
-            receiving_sk=bob_keys["sk"],
-            delegating_pk=alice_keys["delegating_pk"],
-            capsule=capsule,
-            verified_cfrags=cfrags,
-            ciphertext=ciphertext
-        )
+        decrypted = _decrypt(bob_keys["sk"], alice_keys["delegating_pk"], capsule, cfrags, ciphertext)
         assert decrypted == plaintext
         
         # Can also use more than threshold
-        cfrags_all = [reencrypt(capsule=capsule, kfrag=kfrag) for kfrag in kfrags]
-        decrypted2 = decrypt_reencrypted(
-            receiving_sk=bob_keys["sk"],
-            delegating_pk=alice_keys["delegating_pk"],
-            capsule=capsule,
-            verified_cfrags=cfrags_all,
-            ciphertext=ciphertext
-        )
+        cfrags_all = list(_POOL.map(lambda kf: reencrypt(capsule=capsule, kfrag=kf), kfrags))
+        decrypted2 = _decrypt(bob_keys["sk"], alice_keys["delegating_pk"], capsule, cfrags_all, ciphertext)
         assert decrypted2 == plaintext
 
 
 class TestUmbralSecurityProperties:
     """Test security properties of the PRE scheme"""
     
-    def test_wrong_recipient_cannot_decrypt(self):
+    def test_wrong_recipient_cannot_decrypt(self, alice_keys):
         """
         Test that a different recipient cannot decrypt.
         """
         # Alice's keys
         alice_sk = SecretKey.random()
         alice_pk = alice_sk.public_key()
-        alice_signing_sk = SecretKey.random()
-        alice_signer = Signer(alice_signing_sk)
+        alice_signer = alice_keys["signer"]
         
         # Bob's keys (intended recipient)
         bob_sk = SecretKey.random()
@@ -418,26 +393,14 @@ class TestUmbralSecurityProperties:
         cfrag = reencrypt(capsule=capsule, kfrag=kfrags[0])
         
         # Bob can decrypt
-        bob_decrypted = decrypt_reencrypted(
-            receiving_sk=bob_sk,
-            delegating_pk=alice_pk,
-            capsule=capsule,
-            verified_cfrags=[cfrag],
-            ciphertext=ciphertext
-        )
+        bob_decrypted = _decrypt(bob_sk, alice_pk, capsule, [cfrag], ciphertext)
         assert bob_decrypted == plaintext
         
         # Charlie cannot decrypt (wrong key)
         with pytest.raises(ValueError):
-            decrypt_reencrypted(
-                receiving_sk=charlie_sk,
-                delegating_pk=alice_pk,
-                capsule=capsule,
-                verified_cfrags=[cfrag],
-                ciphertext=ciphertext
-            )
+            _decrypt(charlie_sk, alice_pk, capsule, [cfrag], ciphertext)
     
-    def test_cfrag_verification(self):
+    def test_cfrag_verification(self, alice_keys):
         """
         Test that invalid cfrags are detected during verification.
         Ref: https://pyumbral.readthedocs.io/en/latest/api.html#umbral.CapsuleFrag.verify
@@ -445,9 +408,7 @@ class TestUmbralSecurityProperties:
         # Alice's keys
         alice_sk = SecretKey.random()
         alice_pk = alice_sk.public_key()
-        alice_signing_sk = SecretKey.random()
-        alice_signer = Signer(alice_signing_sk)
-        alice_verifying_key = alice_signing_sk.public_key()
+        alice_verifying_key = alice_keys["signing_sk"].public_key()
         
         # Bob's keys
         bob_sk = SecretKey.random()
@@ -478,7 +439,6 @@ class TestUmbralSecurityProperties:
         cfrag_received = CapsuleFrag.from_bytes(cfrag_bytes)
         
         # Verification should fail because signer doesn't match
-        from umbral import VerificationError
         with pytest.raises(VerificationError):
             cfrag_received.verify(
                 capsule=capsule,
@@ -505,17 +465,17 @@ class TestUmbralEdgeCases:
         sk = SecretKey.random()
         pk = sk.public_key()
         
-        # 1MB of data
-        plaintext = b"x" * (1024 * 1024)
+        # 1MB of data (zero-filled; a single allocation)
+        plaintext = bytes(1 << 20)
         capsule, ciphertext = encrypt(pk, plaintext)
         decrypted = decrypt_original(sk, capsule, ciphertext)
         assert decrypted == plaintext
     
-    def test_minimum_threshold(self):
+    def test_minimum_threshold(self, alice_keys):
         """Test with minimum threshold (1-of-1)"""
         alice_sk = SecretKey.random()
         alice_pk = alice_sk.public_key()
-        alice_signer = Signer(SecretKey.random())
+        alice_signer = alice_keys["signer"]
         
         bob_sk = SecretKey.random()
         bob_pk = bob_sk.public_key()
@@ -533,13 +493,7 @@ class TestUmbralEdgeCases:
         
         cfrag = reencrypt(capsule=capsule, kfrag=kfrags[0])
         
-        decrypted = decrypt_reencrypted(
-            receiving_sk=bob_sk,
-            delegating_pk=alice_pk,
-            capsule=capsule,
-            verified_cfrags=[cfrag],
-            ciphertext=ciphertext
-        )
+        decrypted = _decrypt(bob_sk, alice_pk, capsule, [cfrag], ciphertext)
         assert decrypted == plaintext
 
 
@@ -567,10 +521,10 @@ class TestServiceFlowSimulation:
         alice_signing_pk = alice_signing_sk.public_key()
         
         vault_storage[f"umbral/owners/{alice_id}"] = {
-            "delegating_secret_key": alice_delegating_sk.to_secret_bytes().hex(),
-            "public_key": bytes(alice_delegating_pk).hex(),
-            "signing_secret_key": alice_signing_sk.to_secret_bytes().hex(),
-            "verifying_key": bytes(alice_signing_pk).hex()
+            "delegating_secret_key": alice_delegating_sk.to_secret_bytes(),
+            "public_key": bytes(alice_delegating_pk),
+            "signing_secret_key": alice_signing_sk.to_secret_bytes(),
+            "verifying_key": bytes(alice_signing_pk)
         }
         
         # === /prepare for Bob (recipient) ===
@@ -580,10 +534,10 @@ class TestServiceFlowSimulation:
         bob_signing_sk = SecretKey.random()
         
         vault_storage[f"umbral/owners/{bob_id}"] = {
-            "delegating_secret_key": bob_sk.to_secret_bytes().hex(),
-            "public_key": bytes(bob_pk).hex(),
-            "signing_secret_key": bob_signing_sk.to_secret_bytes().hex(),
-            "verifying_key": bytes(bob_signing_sk.public_key()).hex()
+            "delegating_secret_key": bob_sk.to_secret_bytes(),
+            "public_key": bytes(bob_pk),
+            "signing_secret_key": bob_signing_sk.to_secret_bytes(),
+            "verifying_key": bytes(bob_signing_sk.public_key())
         }
         
         # === Encrypt data (simulating /encrypt) ===
@@ -594,22 +548,19 @@ class TestServiceFlowSimulation:
         
         # === /rekey ===
         rekey_id = "rekey-12345"
-        expiry = int(time.time()) + 3600  # 1 hour from now
+        # Sample the clock once; expiry is a Unix timestamp, so wall-clock
+        # time (not time.monotonic()) is the right source
+        now = int(time.time())
+        expiry = now + 3600  # 1 hour from now
         
         # Reconstruct keys from storage (as service does)
         owner_data = vault_storage[f"umbral/owners/{alice_id}"]
         recipient_data = vault_storage[f"umbral/owners/{bob_id}"]
         
-        delegating_sk = SecretKey.from_bytes(
-            bytes.fromhex(owner_data["delegating_secret_key"])
-        )
-        signing_sk = SecretKey.from_bytes(
-            bytes.fromhex(owner_data["signing_secret_key"])
-        )
+        delegating_sk = SecretKey.from_bytes(owner_data["delegating_secret_key"])
+        signing_sk = SecretKey.from_bytes(owner_data["signing_secret_key"])
         signer = Signer(signing_sk)
-        receiving_pk = PublicKey.from_bytes(
-            bytes.fromhex(recipient_data["public_key"])
-        )
+        receiving_pk = PublicKey.from_bytes(recipient_data["public_key"])
         
         kfrags = generate_kfrags(
             delegating_sk=delegating_sk,
@@ -634,34 +585,28 @@ class TestServiceFlowSimulation:
         rekey_data = vault_storage[f"umbral/rekeys/{rekey_id}"]
         
         # Check expiry (should pass)
-        assert int(time.time()) <= rekey_data["expiry"]
+        assert now <= rekey_data["expiry"]
         
         # Deserialize capsule
         capsule_restored = Capsule.from_bytes(base64.b64decode(capsule_b64))
         
         # Perform re-encryption
-        cfrags = []
-        for kfrag_b64 in rekey_data["kfrags"]:
-            kfrag = VerifiedKeyFrag.from_verified_bytes(base64.b64decode(kfrag_b64))
-            cfrag = reencrypt(capsule=capsule_restored, kfrag=kfrag)
-            cfrags.append(cfrag)
+        kfrags_restored = [
+            VerifiedKeyFrag.from_verified_bytes(base64.b64decode(kfrag_b64))
+            for kfrag_b64 in rekey_data["kfrags"]
+        ]
+        cfrags = list(_POOL.map(
+            lambda kf: reencrypt(capsule=capsule_restored, kfrag=kf), kfrags_restored
+        ))
         
         cfrags_b64 = [base64.b64encode(bytes(cf)).decode() for cf in cfrags]
         
         # === /decrypt (Bob's side) ===
         # Reconstruct recipient's secret key
-        receiving_sk = SecretKey.from_bytes(
-            bytes.fromhex(recipient_data["delegating_secret_key"])
-        )
-        delegating_pk = PublicKey.from_bytes(
-            bytes.fromhex(rekey_data["owner_public_key"])
-        )
-        verifying_pk = PublicKey.from_bytes(
-            bytes.fromhex(rekey_data["owner_verifying_key"])
-        )
-        receiving_pk = PublicKey.from_bytes(
-            bytes.fromhex(rekey_data["recipient_public_key"])
-        )
+        receiving_sk = SecretKey.from_bytes(recipient_data["delegating_secret_key"])
+        delegating_pk = PublicKey.from_bytes(rekey_data["owner_public_key"])
+        verifying_pk = PublicKey.from_bytes(rekey_data["owner_verifying_key"])
+        receiving_pk = PublicKey.from_bytes(rekey_data["recipient_public_key"])
         
         # Deserialize cfrags and verify
         verified_cfrags = []
@@ -676,12 +621,9 @@ class TestServiceFlowSimulation:
             verified_cfrags.append(verified_cfrag)
         
         # Decrypt
-        decrypted = decrypt_reencrypted(
-            receiving_sk=receiving_sk,
-            delegating_pk=delegating_pk,
-            capsule=capsule_restored,
-            verified_cfrags=verified_cfrags,
-            ciphertext=base64.b64decode(ciphertext_b64)
+        decrypted = _decrypt(
+            receiving_sk, delegating_pk, capsule_restored, verified_cfrags,
+            base64.b64decode(ciphertext_b64)
         )
         
         assert decrypted == plaintext
@@ -691,8 +633,9 @@ class TestServiceFlowSimulation:
         Test that re-encryption is rejected for expired rekeys.
         """
         # Simulate an expired rekey
-        expiry = int(time.time()) - 1  # 1 second in the past
+        # Single clock sample: both sides of the comparison share it
         current_time = int(time.time())
+        expiry = current_time - 1  # 1 second in the past
         
         # This check should fail
         assert current_time > expiry, "Rekey should be expired"